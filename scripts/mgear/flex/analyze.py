@@ -10,8 +10,9 @@ you want to update with Flex
 from __future__ import absolute_import
 from mgear.flex import logger
 from mgear.flex.decorators import timer
-from mgear.flex.query import get_matching_shapes_from_group
-from mgear.flex.query import get_missing_shapes_from_group
+from mgear.flex.query import get_clean_matching_shapes
+from mgear.flex.query import get_matching_shapes
+from mgear.flex.query import get_missing_shapes
 from mgear.flex.query import is_matching_bouding_box
 from mgear.flex.query import is_matching_count
 from mgear.flex.query import is_matching_type
@@ -31,8 +32,11 @@ def analyze_groups(source, target):
     logger.debug("Analysing the following groups - source: {}  - target: {}"
                  .format(source, target))
 
+    # gets the prefix-less shapes once for the matching and missing shapes
+    sources_dict, targets_dict = get_clean_matching_shapes(source, target)
+
     # gets the matching shapes
-    matching_shapes = get_matching_shapes_from_group(source, target)
+    matching_shapes = get_matching_shapes(sources_dict, targets_dict)
 
     # gets mismatching shape types
     mismatched_types = [x for x in matching_shapes if not is_matching_type(
@@ -52,9 +56,9 @@ def analyze_groups(source, target):
     logger.info("Mismatch volume shapes: {}".format(mismatched_bbox))
     logger.warning("-" * 90)
     logger.warning("Source missing shapes: {}" .format(
-        get_missing_shapes_from_group(source, target)))
+        get_missing_shapes(sources_dict, targets_dict)))
     logger.warning("Target missing shapes: {}" .format(
-        get_missing_shapes_from_group(target, source)))
+        get_missing_shapes(targets_dict, sources_dict)))
     logger.warning("-" * 90)
 
     return matching_shapes, mismatched_types, mismatched_count, mismatched_bbox
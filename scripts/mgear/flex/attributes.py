@@ -20,6 +20,24 @@ OBJECT_DISPLAY_ATTRIBUTES = ["visibility",
                              "ignoreHwShader",
                              "hideOnPlayback"]
 
+SHAPE_TYPE_ATTRIBUTES = {"mesh": {"points": "pnts",
+                                  "input": "inMesh",
+                                  "output": "outMesh",
+                                  "output_world": "worldMesh",
+                                  "p_axes": ("pntx", "pnty", "pntz")},
+                         "nurbsCurve": {"points": "controlPoints",
+                                        "input": "create",
+                                        "output": "local",
+                                        "output_world": "worldSpace",
+                                        "p_axes": ("xValue", "yValue",
+                                                   "zValue")},
+                         "nurbsSurface": {"points": "controlPoints",
+                                          "input": "create",
+                                          "output": "local",
+                                          "output_world": "worldSpace",
+                                          "p_axes": ("xValue", "yValue",
+                                                     "zValue")}}
+
 RENDER_STATS_ATTRIBUTES = ["castsShadows",
                            "receiveShadows",
                            "holdOut",
@@ -35,3 +53,31 @@ RENDER_STATS_ATTRIBUTES = ["castsShadows",
                            "shadingSamplesOverride",
                            "shadingSamples",
                            "maxShadingSamples"]
+
+# value type of the OBJECT_DISPLAY_ATTRIBUTES, COMPONENT_DISPLAY_ATTRIBUTES
+# and RENDER_STATS_ATTRIBUTES. Used to read and set them without querying
+# their type at runtime
+MAYA_ATTRIBUTES_TYPES = {"visibility": "bool",
+                         "template": "bool",
+                         "lodVisibility": "bool",
+                         "displayHWEnvironment": "bool",
+                         "ignoreHwShader": "bool",
+                         "hideOnPlayback": "bool",
+                         "displayColors": "bool",
+                         "displayColorChannel": "string",
+                         "materialBlend": "int",
+                         "castsShadows": "bool",
+                         "receiveShadows": "bool",
+                         "holdOut": "bool",
+                         "motionBlur": "bool",
+                         "primaryVisibility": "bool",
+                         "smoothShading": "bool",
+                         "visibleInReflections": "bool",
+                         "visibleInRefractions": "bool",
+                         "doubleSided": "bool",
+                         "opposite": "bool",
+                         "geometryAntialiasingOverride": "bool",
+                         "antialiasingLevel": "int",
+                         "shadingSamplesOverride": "bool",
+                         "shadingSamples": "int",
+                         "maxShadingSamples": "int"}
@@ -8,6 +8,7 @@ decorators.
 """
 
 # imports
+from functools import wraps
 from maya import cmds
 import time
 from mgear.flex import logger
@@ -37,6 +38,58 @@ def finished_running(function):
     return wrapper_function
 
 
+def fast_update(function):
+    """ Speeds up bulk scene edits while the function is running
+
+    Turns the evaluation manager off (DG mode), suspends the viewport
+    refresh, disables the cycle check and the auto keyframe and collapses
+    all the edits into a single undo step. The previous states are restored
+    once the function finishes, even if it fails.
+
+    :param function: your decorated function
+    :type function: function
+
+    :return: your decorated function
+    :rtype: function
+    """
+
+    @wraps(function)
+    def wrapper_function(*args, **kwars):
+        # stores the current states
+        evaluation_mode = cmds.evaluationManager(query=True, mode=True)[0]
+        cycle_check = cmds.cycleCheck(query=True, evaluation=True)
+        auto_keyframe = cmds.autoKeyframe(query=True, state=True)
+        refresh_state = cmds.refresh(query=True, suspend=True)
+
+        logger.debug("Suspending evaluation, refresh and undo queue")
+
+        cmds.evaluationManager(mode="off")
+        cmds.cycleCheck(evaluation=False)
+        cmds.autoKeyframe(state=False)
+        cmds.refresh(suspend=True)
+        cmds.undoInfo(openChunk=True, chunkName=function.__name__)
+
+        try:
+            # runs decorated function
+            function_exec = function(*args, **kwars)
+
+        finally:
+            # restores the states
+            cmds.undoInfo(closeChunk=True)
+            cmds.refresh(suspend=refresh_state)
+            cmds.autoKeyframe(state=auto_keyframe)
+            cmds.cycleCheck(evaluation=cycle_check)
+            cmds.evaluationManager(mode=evaluation_mode)
+            cmds.dgdirty(allPlugs=True)
+
+            # redraws the viewport once with all the updates
+            if not refresh_state and not cmds.about(batch=True):
+                cmds.refresh(force=True)
+
+        return function_exec
+    return wrapper_function
+
+
 def hold_selection(function):
     """ Holds the current Maya selection after running the function
 
@@ -52,6 +52,8 @@ class Flex(object):
                                  "plugin_attributes": False,
                                  "hold_transform_values": True,
                                  "mismatched_topologies": True,
+                                 "normal_skin_transfer": False,
+                                 "skip_identical_shapes": True,
                                  }
 
     def __check_source_and_target_properties(self):
@@ -82,6 +84,8 @@ class Flex(object):
            * plugin_attributes
            * hold_transform_values
            * mismatched_topologies
+           * normal_skin_transfer
+           * skip_identical_shapes
         """
 
         # gather ui options
@@ -103,6 +107,10 @@ class Flex(object):
             self.ui.transformed_hold_check.isChecked())
         ui_options["mismatched_topologies"] = (
             self.ui.mismatched_topologies.isChecked())
+        ui_options["normal_skin_transfer"] = (
+            self.ui.normal_skin_transfer.isChecked())
+        ui_options["skip_identical_shapes"] = (
+            self.ui.skip_identical_shapes.isChecked())
 
         return ui_options
 
@@ -420,6 +428,9 @@ class Flex(object):
                    "component_display": False,
                    "plugin_attributes": False,
                    "hold_transform_values": True,
+                   "mismatched_topologies": True,
+                   "normal_skin_transfer": False,
+                   "skip_identical_shapes": True,
                   }
         """
 
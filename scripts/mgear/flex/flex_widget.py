@@ -94,7 +94,19 @@ class FlexDialog(QtWidgets.QDialog):
             "Mismatched topologies")
         self.mismatched_topologies.setChecked(True)
 
+        # transfer skinning using normals on mismatched topologies
+        self.normal_skin_transfer = QtWidgets.QCheckBox(
+            "Normal based skinning")
+        self.normal_skin_transfer.setChecked(False)
+
+        # skips shapes already identical to the source
+        self.skip_identical_shapes = QtWidgets.QCheckBox(
+            "Skip identical shapes")
+        self.skip_identical_shapes.setChecked(True)
+
         layout.addWidget(self.mismatched_topologies)
+        layout.addWidget(self.normal_skin_transfer)
+        layout.addWidget(self.skip_identical_shapes)
 
     def layout_widgets(self):
         """ Creates the general UI layouts
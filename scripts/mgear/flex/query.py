@@ -10,12 +10,23 @@ and update functions of Flex
 from __future__ import absolute_import
 import math
 from maya import OpenMaya
+from maya import OpenMayaAnim
 from maya import cmds
 import os
+import re
 import tempfile
 from mgear.flex import logger  # @UnusedImport
+from mgear.flex.attributes import SHAPE_TYPE_ATTRIBUTES
 from mgear.flex.decorators import timer  # @UnusedImport
 
+# lock, keyable and channel box flags returned by getSetAttrCmds along with
+# the attribute value
+SET_ATTR_STATE_FLAGS = re.compile(r"\s-(?:l|lock|k|keyable|cb|channelBox)"
+                                  r"\s+(?:on|off|true|false|yes|no|1|0)\b")
+
+# setAttr commands left without any value once the state flags are removed
+SET_ATTR_NO_VALUE = re.compile(r'^setAttr\s+"[^"]*"\s*;?\s*$')
+
 
 def get_clean_matching_shapes(source, target):
     """ Returns the prefix-less found shapes under the given groups
@@ -187,10 +198,75 @@ def get_parent(element):
 
     :param element: A Maya dag node
     :type element: string
+
+    :return: the parent full path name in a list or None if no parent found
+    :rtype: list
+    """
+
+    # gets the element dag path
+    m_selectin_list = OpenMaya.MSelectionList()
+    m_selectin_list.add(element)
+    m_dag_path = OpenMaya.MDagPath()
+
+    try:
+        m_selectin_list.getDagPath(0, m_dag_path)
+    except RuntimeError:
+        return None
+
+    # walks up to the parent transform
+    m_dag_path.pop()
+
+    if not m_dag_path.length():
+        return None
+
+    return [m_dag_path.fullPathName()]
+
+
+def get_plug_value_type(m_plug):
+    """ Returns the value type of the given plug when it holds a single value
+
+    :param m_plug: the Maya plug to check
+    :type m_plug: MPlug
+
+    :return: bool, int or double. None for any other kind of attribute
+    :rtype: str
     """
 
-    return cmds.listRelatives(element, parent=True, fullPath=True,
-                              type="transform")
+    # array and compound plugs don't hold a single value
+    if m_plug.isArray() or m_plug.isCompound():
+        return None
+
+    # children of multi compound attributes have no element index to read
+    m_parent_plug = m_plug
+    while m_parent_plug.isChild():
+        m_parent_plug = m_parent_plug.parent()
+        if m_parent_plug.isArray():
+            return None
+
+    m_attribute = m_plug.attribute()
+
+    if m_attribute.hasFn(OpenMaya.MFn.kEnumAttribute):
+        return "int"
+
+    if not m_attribute.hasFn(OpenMaya.MFn.kNumericAttribute):
+        return None
+
+    unit_type = OpenMaya.MFnNumericAttribute(m_attribute).unitType()
+
+    if unit_type == OpenMaya.MFnNumericData.kBoolean:
+        return "bool"
+
+    if unit_type in (OpenMaya.MFnNumericData.kByte,
+                     OpenMaya.MFnNumericData.kChar,
+                     OpenMaya.MFnNumericData.kShort,
+                     OpenMaya.MFnNumericData.kInt):
+        return "int"
+
+    if unit_type in (OpenMaya.MFnNumericData.kFloat,
+                     OpenMaya.MFnNumericData.kDouble):
+        return "double"
+
+    return None
 
 
 def get_prefix_less_name(element):
@@ -241,6 +317,61 @@ def get_resources_path():
     return "{}/resources".format(file_dir)
 
 
+def get_set_attr_cmds(m_plug, target):
+    """ Returns the setAttr commands copying the plug value on the target
+
+    The commands given by getSetAttrCmds use relative plug names
+    (".attribute") so the target node name is inserted. The lock, keyable
+    and channel box states are removed so only the value is copied.
+
+    :param m_plug: the source Maya plug
+    :type m_plug: MPlug
+
+    :param target: the target node name
+    :type target: string
+
+    :return: the setAttr mel commands
+    :rtype: list
+    """
+
+    m_set_attr_cmds = OpenMaya.MStringArray()
+    m_plug.getSetAttrCmds(m_set_attr_cmds, OpenMaya.MPlug.kAll, True)
+
+    target_prefix = '"{}.'.format(target)
+    set_attr_cmds = []
+    for i in range(m_set_attr_cmds.length()):
+        # the state flags are placed before the quoted plug name
+        flags, quote, plug_value = m_set_attr_cmds[i].partition('"')
+        set_attr_cmd = SET_ATTR_STATE_FLAGS.sub("", flags) + quote + plug_value
+        if not SET_ATTR_NO_VALUE.match(set_attr_cmd):
+            set_attr_cmds.append(set_attr_cmd.replace('".', target_prefix, 1))
+
+    return set_attr_cmds
+
+
+def get_skin_cluster_node(skin_node):
+    """ Returns a Maya MFnSkinCluster from the given skin cluster node
+
+    :param skin_node: Maya skin cluster node name
+    :type skin_node: string
+
+    :return: the skin cluster in a Maya MFnSkinCluster object
+    :rtype: MFnSkinCluster
+    """
+
+    # adds the skin node into an maya selection list
+    m_selectin_list = OpenMaya.MSelectionList()
+    m_selectin_list.add(skin_node)
+
+    # creates an MObject
+    m_object = OpenMaya.MObject()
+
+    # gets the MObject from the list
+    m_selectin_list.getDependNode(0, m_object)
+
+    return OpenMayaAnim.MFnSkinCluster(m_object)
+
+
 def get_shape_orig(shape):
     """ Finds the orig (intermediate shape) on the given shape
 
@@ -257,13 +388,12 @@ def get_shape_orig(shape):
               and stable ways of doing this.
     """
 
-    # gets attributes names
+    # gets attributes names and the shape type
     attributes = get_shape_type_attributes(shape)
 
-    orig_shapes = []
-    {orig_shapes.append(n) for n in (cmds.ls(cmds.listHistory(
+    orig_shapes = [n for n in cmds.ls(cmds.listHistory(
         "{}.{}".format(shape, attributes["input"])),
-        type=cmds.objectType(shape))) if n != shape}
+        type=attributes["type"]) if n != shape]
 
     if len(orig_shapes) == 0:
         orig_shapes = None
@@ -278,6 +408,10 @@ def get_shape_type_attributes(shape):
     the corresponding shape type. Mesh type of nodes will be set as default
     but nurbs surfaces and nurbs curves are supported too.
 
+    The shape node type is also returned in order to avoid querying it again.
+    Attributes for mesh, nurbs surface and nurbs curve are taken from
+    SHAPE_TYPE_ATTRIBUTES, any other shape type queries them on its history.
+
     on mesh nodes: points = pnts
                    output = outMesh
                    input = inMesh
@@ -295,6 +429,14 @@ def get_shape_type_attributes(shape):
     :rtype: dict
     """
 
+    shape_type = cmds.objectType(shape)
+
+    # returns the known attributes for the shapes types supported by flex
+    if shape_type in SHAPE_TYPE_ATTRIBUTES:
+        shape_attributes = dict(SHAPE_TYPE_ATTRIBUTES[shape_type])
+        shape_attributes["type"] = shape_type
+        return shape_attributes
+
     # declares the dict
     shape_attributes = dict()
 
@@ -307,13 +449,7 @@ def get_shape_type_attributes(shape):
     shape_attributes["output_world"] = "{}".format(cmds.listHistory(
         shape, query=True, futureWorldAttr=True)[0].split(".")[-1])
     shape_attributes["p_axes"] = ("pntx", "pnty", "pntz")
-
-    if cmds.objectType(shape) == "nurbsSurface" or (cmds.objectType(shape) ==
-                                                    "nurbsCurve"):
-
-        # set the default values for a nurbs node type
-        shape_attributes["points"] = "controlPoints"
-        shape_attributes["p_axes"] = ("xValue", "yValue", "zValue")
+    shape_attributes["type"] = shape_type
 
     return shape_attributes
 
@@ -376,6 +512,36 @@ def get_transform_selection():
     return selection or None
 
 
+def get_user_attributes(element, m_depend_node=None):
+    """ Returns the user defined attributes on the given element
+
+    The dynamic attributes are gathered in one pass over the node attributes
+    instead of using the listAttr command.
+
+    :param element: Maya node to get the user attributes from
+    :type element: string
+
+    :param m_depend_node: the element dependency node if already resolved
+    :type m_depend_node: MFnDependencyNode
+
+    :return: the user defined attributes names
+    :rtype: list
+    """
+
+    if m_depend_node is None:
+        m_depend_node = get_dependency_node(element)
+
+    # loops on the node attributes keeping the dynamic ones
+    user_attributes = []
+    m_attribute = OpenMaya.MFnAttribute()
+    for i in range(m_depend_node.attributeCount()):
+        m_attribute.setObject(m_depend_node.attribute(i))
+        if m_attribute.isDynamic():
+            user_attributes.append(m_attribute.name())
+
+    return user_attributes
+
+
 def get_vertice_count(shape):
     """ Returns the number of vertices for the given shape
 
@@ -386,6 +552,14 @@ def get_vertice_count(shape):
     :rtype: int
     """
 
+    # mesh nodes vertices count is given directly by the API
+    if cmds.objectType(shape) == "mesh":
+        m_selectin_list = OpenMaya.MSelectionList()
+        m_selectin_list.add(shape)
+        m_dag_path = OpenMaya.MDagPath()
+        m_selectin_list.getDagPath(0, m_dag_path)
+        return OpenMaya.MFnMesh(m_dag_path).numVertices()
+
     return len(cmds.ls("{}.{}[*]".format(shape, get_shape_type_attributes(
         shape)["points"]), flatten=True))
 
@@ -469,6 +643,36 @@ def is_matching_count(source, target):
         return False
 
 
+def is_matching_geometry(source, target, node_type=None):
+    """ Checks if the source and target mesh shapes have the same geometry
+
+    The vertices, edges, faces, uvs, colors and normals are compared using
+    the polyCompare command. Shapes that aren't meshes never match.
+
+    :param source: source shape node
+    :type source: string
+
+    :param target: target shape node
+    :type target: string
+
+    :param node_type: the source shape node type if already known
+    :type node_type: string
+
+    :return: If source and target geometry matches or not
+    :rtype: bool
+    """
+
+    if (node_type or cmds.objectType(source)) != "mesh":
+        return False
+
+    # polyCompare returns 0 when no difference is found and fails if the
+    # target isn't a mesh
+    try:
+        return not cmds.polyCompare(source, target)
+    except RuntimeError:
+        return False
+
+
 def is_matching_type(source, target):
     """ Checks if the source and target shape type matches
 
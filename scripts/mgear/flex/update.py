@@ -9,36 +9,80 @@ flex.update module handles the updating rig process
 # imports
 from __future__ import absolute_import
 
+from itertools import chain
+from maya import OpenMaya
 from maya import cmds
+from maya import mel
 
 from mgear.flex import logger
 from mgear.flex.attributes import BLENDSHAPE_TARGET
 from mgear.flex.attributes import COMPONENT_DISPLAY_ATTRIBUTES
+from mgear.flex.attributes import MAYA_ATTRIBUTES_TYPES
 from mgear.flex.attributes import OBJECT_DISPLAY_ATTRIBUTES
 from mgear.flex.attributes import RENDER_STATS_ATTRIBUTES
+from mgear.flex.decorators import fast_update
 from mgear.flex.decorators import timer
+from mgear.flex.query import get_clean_matching_shapes
 from mgear.flex.query import get_deformers
-from mgear.flex.query import get_matching_shapes_from_group
-from mgear.flex.query import get_missing_shapes_from_group
+from mgear.flex.query import get_dependency_node
+from mgear.flex.query import get_matching_shapes
+from mgear.flex.query import get_missing_shapes
 from mgear.flex.query import get_parent
+from mgear.flex.query import get_plug_value_type
+from mgear.flex.query import get_set_attr_cmds
 from mgear.flex.query import get_shape_orig
-from mgear.flex.query import is_lock_attribute
+from mgear.flex.query import get_shape_type_attributes
+from mgear.flex.query import get_user_attributes
+from mgear.flex.query import get_vertice_count
 from mgear.flex.query import is_matching_bouding_box
 from mgear.flex.query import is_matching_count
+from mgear.flex.query import is_matching_geometry
 from mgear.flex.query import is_matching_type
 from mgear.flex.query import lock_unlock_attribute
-from mgear.flex.update_utils import add_attribute
 from mgear.flex.update_utils import copy_cluster_weights
 from mgear.flex.update_utils import copy_map1_name
 from mgear.flex.update_utils import copy_skin_weights
+from mgear.flex.update_utils import copy_skin_weights_normal
 from mgear.flex.update_utils import create_deformers_backups
 from mgear.flex.update_utils import delete_transform_from_nodes
+from mgear.flex.update_utils import get_add_attribute_cmd
 from mgear.flex.update_utils import set_deformer_state
 from mgear.flex.update_utils import update_shape
-import pymel.core as pm
-
-
-def update_attribute(source, target, attribute_name):
+from mgear.flex.update_utils import update_shapes
+
+# MPlug reader and setAttr flags for each attribute value type copied with
+# its typed plug value
+PLUG_VALUE_TYPES = {
+    "bool": (OpenMaya.MPlug.asBool, {}),
+    "int": (OpenMaya.MPlug.asInt, {}),
+    "double": (OpenMaya.MPlug.asDouble, {}),
+    "string": (OpenMaya.MPlug.asString, {"type": "string"}),
+}
+
+# setAttr calls for the data attribute types needing the type flag. Used when
+# the attribute value is copied using getAttr
+ATTRIBUTE_SETTERS = {
+    "string": lambda attr, value: cmds.setAttr(attr, value or "",
+                                               type="string"),
+    "stringArray": lambda attr, value: cmds.setAttr(attr, len(value or []),
+                                                    *(value or []),
+                                                    type="stringArray"),
+    "matrix": lambda attr, value: cmds.setAttr(attr, value, type="matrix"),
+    "doubleArray": lambda attr, value: cmds.setAttr(attr, value or [],
+                                                    type="doubleArray"),
+    "Int32Array": lambda attr, value: cmds.setAttr(attr, value or [],
+                                                   type="Int32Array"),
+    "pointArray": lambda attr, value: cmds.setAttr(
+        attr, len(value or []), *chain.from_iterable(value or []),
+        type="pointArray"),
+    "vectorArray": lambda attr, value: cmds.setAttr(
+        attr, len(value or []), *chain.from_iterable(value or []),
+        type="vectorArray"),
+}
+
+
+def update_attribute(source, target, attribute_name, m_source_node=None,
+                     m_target_node=None):
     """ Updates the given attribute value
 
     ..note:: This in a generic method to **setAttr** all type of attributes
@@ -57,41 +101,65 @@ def update_attribute(source, target, attribute_name):
 
     :param attribute_name: the attribute name to set in the given target
     :type attribute_name: str
+
+    :param m_source_node: the source dependency node if already resolved
+    :type m_source_node: MFnDependencyNode
+
+    :param m_target_node: the target dependency node if already resolved
+    :type m_target_node: MFnDependencyNode
     """
 
-    if not cmds.objExists("{}.{}".format(target, attribute_name)):
+    if not m_target_node:
+        m_target_node = get_dependency_node(target)
+
+    if not m_target_node.hasAttribute(attribute_name):
         logger.warning("The current target {} does not have attribute: {}"
                        .format(target, attribute_name))
         return
 
     # checks for locking
-    lock = is_lock_attribute(target, attribute_name)
+    lock = m_target_node.findPlug(attribute_name, False).isLocked()
 
-    if not lock_unlock_attribute(target, attribute_name, False):
+    if lock and not lock_unlock_attribute(target, attribute_name, False):
         logger.warning("The given attribute {} can't be updated on {}"
                        .format(attribute_name, target))
         return
 
-    # creates pymel nodes to get and apply attributes from
-    # I am using pymel as they managed to handle default attributes on
-    # referenced nodes correctly. When using MPlug.getSetAttrCmd with kAll
-    # this doesn't return the command correctly when nodes in reference have
-    # the attribute left as default
-    py_source = pm.PyNode(source)
-    py_target = pm.PyNode(target)
+    if not m_source_node:
+        m_source_node = get_dependency_node(source)
+
+    # gets the source value setAttr commands on the target
+    set_attr_cmds = get_set_attr_cmds(
+        m_source_node.findPlug(attribute_name, False), target)
 
     # sets the attribute value
     try:
-        attr_value = py_source.attr(attribute_name).get()
-        py_target.attr(attribute_name).set(attr_value)
+        if set_attr_cmds:
+            mel.eval("\n".join(set_attr_cmds))
+
+        # nodes in reference with the attribute left as default don't return
+        # any setAttr command so the value is copied using getAttr
+        else:
+            source_attribute = "{}.{}".format(source, attribute_name)
+            target_attribute = "{}.{}".format(target, attribute_name)
+            attr_value = cmds.getAttr(source_attribute)
+            attr_setter = ATTRIBUTE_SETTERS.get(
+                cmds.getAttr(source_attribute, type=True))
+            if attr_setter:
+                attr_setter(target_attribute, attr_value)
+            elif isinstance(attr_value, list):
+                cmds.setAttr(target_attribute, *attr_value[0])
+            else:
+                cmds.setAttr(target_attribute, attr_value)
 
     except Exception as e:
         logger.warning("The given attribute ({}) can't be updated on {}"
                        .format(attribute_name, target))
         return e
 
-    if lock:
-        lock_unlock_attribute(target, attribute_name, True)
+    finally:
+        if lock:
+            lock_unlock_attribute(target, attribute_name, True)
 
 
 def update_blendshapes_nodes(source_nodes, target_nodes):
@@ -119,26 +187,29 @@ def update_blendshapes_nodes(source_nodes, target_nodes):
             continue
 
         # gets source and targets indices
-        targets_idx = cmds.getAttr("{}.weight".format(node), multiIndices=True)
-        source_idx = cmds.getAttr("{}.weight".format(match_node[0]),
-                                  multiIndices=True)
+        source_weight = "{}.weight".format(match_node[0])
+        target_weight = "{}.weight".format(node)
+        targets_idx = cmds.getAttr(target_weight, multiIndices=True)
+        source_idx = cmds.getAttr(source_weight, multiIndices=True)
+
+        # maps the source targets names to their indices (first one found)
+        source_names = {}
+        for x in reversed(source_idx or []):
+            source_names[cmds.aliasAttr("{}[{}]".format(source_weight, x),
+                                        query=True)] = x
 
         for idx in targets_idx:
             # blendshape target name
-            target_name = cmds.aliasAttr("{}.weight[{}]".format(node, idx),
+            target_name = cmds.aliasAttr("{}[{}]".format(target_weight, idx),
                                          query=True)
 
             # gets corresponding source idx
-            match_idx = [x for x in source_idx if cmds.aliasAttr(
-                "{}.weight[{}]".format(match_node[0], x),
-                query=True) == target_name]
-
-            if not match_idx:
+            if target_name not in source_names:
                 continue
 
             # input target group attribute
             source_name = (BLENDSHAPE_TARGET.format(match_node[0],
-                                                    match_idx[0]))
+                                                    source_names[target_name]))
             target_name = (BLENDSHAPE_TARGET.format(node, idx))
 
             # loop on actual targets and in-between targets
@@ -174,7 +245,8 @@ def update_clusters_nodes(shape, weight_files):
 
 
 @timer
-def update_deformed_mismatching_shape(source, target, shape_orig):
+def update_deformed_mismatching_shape(source, target, shape_orig,
+                                      normal_skin_transfer=False):
     """ Updates the target shape with the given source shape content
 
     :param source: maya shape node
@@ -185,6 +257,9 @@ def update_deformed_mismatching_shape(source, target, shape_orig):
 
     :param shape_orig: shape orig on the target shape
     :type shape_orig: str
+
+    :param normal_skin_transfer: use normals to transfer the skin weights
+    :type normal_skin_transfer: bool
     """
 
     logger.debug("Running update deformed mismatched shapes")
@@ -197,7 +272,7 @@ def update_deformed_mismatching_shape(source, target, shape_orig):
                        .format(deformers["skinCluster"][0]))
 
     # Turns all deformers envelope off
-    set_deformer_state(deformers, False)
+    envelopes = set_deformer_state(deformers, False)
 
     # creates deformers backups
     bs_nodes, skin_nodes, cluster_nodes = create_deformers_backups(source,
@@ -208,7 +283,8 @@ def update_deformed_mismatching_shape(source, target, shape_orig):
     update_shape(source, shape_orig)
 
     # updates skinning nodes
-    update_skincluster_node(skin_nodes, deformers["skinCluster"])
+    update_skincluster_node(skin_nodes, deformers["skinCluster"],
+                            normal_skin_transfer)
 
     # updates blendshapes nodes
     update_blendshapes_nodes(bs_nodes, deformers["blendShape"])
@@ -219,14 +295,15 @@ def update_deformed_mismatching_shape(source, target, shape_orig):
     # updates uv sets on target shape
     update_uvs_sets(target)
 
-    # Turns all deformers envelope ON
-    set_deformer_state(deformers, True)
+    # Turns all deformers envelope back to their previous values
+    set_deformer_state(deformers, True, envelopes)
 
     # deletes backups
     delete_transform_from_nodes(set(bs_nodes).union(skin_nodes))
 
 
-def update_deformed_shape(source, target, mismatching_topology=True):
+def update_deformed_shape(source, target, options=None, shapes_batch=None,
+                          shape_orig=None):
     """ Updates the target shape with the given source shape content
 
     :param source: maya shape node
@@ -235,12 +312,29 @@ def update_deformed_shape(source, target, mismatching_topology=True):
     :param target: maya shape node
     :type target: str
 
-    :param mismatching_topology: ignore or not mismatching topologies
-    :type mismatching_topology: bool
+    :param options: update options. The mismatched_topologies (True by
+                    default) and normal_skin_transfer (False by default)
+                    keys are used.
+    :type options: dict
+
+    :param shapes_batch: if given matching topology shapes are added to it
+                         instead of being updated. Use update_deformed_shapes
+                         to update all the batched shapes at once.
+    :type shapes_batch: list
+
+    :param shape_orig: the target orig shapes if already queried
+    :type shape_orig: list
     """
 
+    # gets the topology options
+    options = options or {}
+    mismatching_topology = options.get("mismatched_topologies", True)
+    normal_skin_transfer = options.get("normal_skin_transfer", False)
+
     # gets orig shape
-    deform_origin = get_shape_orig(target)
+    deform_origin = shape_orig
+    if deform_origin is None:
+        deform_origin = get_shape_orig(target)
 
     # returns as target is not a deformed shape
     if not deform_origin:
@@ -254,8 +348,11 @@ def update_deformed_shape(source, target, mismatching_topology=True):
                        .format(source, target))
         return
 
+    # checks vertices count once for both topology checks
+    matching_count = is_matching_count(source, target)
+
     # returns if vertices count isn't equal and mismatching isn't requested
-    if not mismatching_topology and not is_matching_count(source, target):
+    if not mismatching_topology and not matching_count:
         logger.warning("{} and {} don't have same shape vertices count."
                        "passing...".format(source, target))
         return
@@ -266,18 +363,40 @@ def update_deformed_shape(source, target, mismatching_topology=True):
     copy_map1_name(source, deform_origin)
 
     # updates on mismatching topology
-    if mismatching_topology and not is_matching_count(source, target):
-        update_deformed_mismatching_shape(source, target, deform_origin)
+    if mismatching_topology and not matching_count:
+        update_deformed_mismatching_shape(source, target, deform_origin,
+                                          normal_skin_transfer)
         return
 
-    # update the shape
-    update_shape(source, deform_origin)
+    # gets the source attributes (source and target share the same type)
+    attributes = get_shape_type_attributes(source)
+
+    # adds the shape to the batch
+    if shapes_batch is not None:
+        shapes_batch.append((source, target, deform_origin, attributes))
+        return
+
+    update_deformed_shapes([(source, target, deform_origin, attributes)])
 
-    # update uvs set on target
-    update_uvs_sets(target)
 
+def update_deformed_shapes(shapes):
+    """ Updates all the given deformed shapes orig at once
+
+    :param shapes: source shape, target shape, target orig shape and source
+                   shape type attributes for each shape to update
+    :type shapes: list(tuple)
+    """
 
-def update_maya_attributes(source, target, attributes):
+    # update the shapes
+    update_shapes([(x[0], x[2], x[3]) for x in shapes])
+
+    # update uvs set on targets
+    for source, target, deform_origin, attributes in shapes:
+        update_uvs_sets(target, attributes["type"])
+
+
+def update_maya_attributes(source, target, attributes, m_source_node=None,
+                           m_target_node=None):
     """ Updates all maya attributes from the given source to the target
 
     :param source: maya shape node
@@ -288,13 +407,100 @@ def update_maya_attributes(source, target, attributes):
 
     :param attributes: list of Maya attributes to be updated
     :type attributes: list
+
+    :param m_source_node: the source dependency node if already resolved
+    :type m_source_node: MFnDependencyNode
+
+    :param m_target_node: the target dependency node if already resolved
+    :type m_target_node: MFnDependencyNode
+
+    .. note:: Attributes listed in MAYA_ATTRIBUTES_TYPES and single value
+              attributes of the same type on source and target are copied
+              with their MPlug typed value. Any other attribute uses the
+              generic update_attribute method.
     """
 
+    if not m_source_node:
+        m_source_node = get_dependency_node(source)
+    if not m_target_node:
+        m_target_node = get_dependency_node(target)
+
     for attribute in attributes:
-        update_attribute(source, target, attribute)
+        if not m_target_node.hasAttribute(attribute):
+            logger.warning("The current target {} does not have attribute: {}"
+                           .format(target, attribute))
+            continue
+
+        m_source_plug = m_source_node.findPlug(attribute, False)
+        m_target_plug = m_target_node.findPlug(attribute, False)
+
+        value_type = MAYA_ATTRIBUTES_TYPES.get(attribute)
+        if not value_type:
+            value_type = get_plug_value_type(m_source_plug)
+            if value_type != get_plug_value_type(m_target_plug):
+                value_type = None
+
+        if value_type:
+            update_plug_value(target, attribute, m_source_plug,
+                              m_target_plug, value_type)
+        else:
+            update_attribute(source, target, attribute, m_source_node,
+                             m_target_node)
+
+
+def update_plug_value(target, attribute, m_source_plug, m_target_plug,
+                      value_type):
+    """ Updates the target plug value with the source plug one
+
+    The value is only set when it differs from the target one. Locked target
+    attributes are unlocked while setting the value and locked back.
+
+    :param target: maya shape node
+    :type target: str
+
+    :param attribute: the attribute name to set on the target
+    :type attribute: str
+
+    :param m_source_plug: the source attribute plug
+    :type m_source_plug: MPlug
 
+    :param m_target_plug: the target attribute plug
+    :type m_target_plug: MPlug
 
-def update_plugin_attributes(source, target):
+    :param value_type: the attribute value type (bool, int, double, string)
+    :type value_type: str
+    """
+
+    if m_target_plug.isDestination():
+        logger.warning("The given attribute {} can't be updated on {}"
+                       .format(attribute, target))
+        return
+
+    plug_reader, set_attr_flags = PLUG_VALUE_TYPES[value_type]
+    lock = m_target_plug.isLocked()
+
+    try:
+        # skips the attribute if the target already has the same value
+        value = plug_reader(m_source_plug)
+        if value == plug_reader(m_target_plug):
+            return
+
+        if lock:
+            cmds.setAttr("{}.{}".format(target, attribute), lock=False)
+        cmds.setAttr("{}.{}".format(target, attribute), value,
+                     **set_attr_flags)
+
+    except RuntimeError:
+        logger.warning("The given attribute {} can't be updated on {}"
+                       .format(attribute, target))
+
+    finally:
+        if lock:
+            lock_unlock_attribute(target, attribute, True)
+
+
+def update_plugin_attributes(source, target, m_source_node=None,
+                             m_target_node=None):
     """ Updates all maya plugin defined attributes
 
     :param source: maya shape node
@@ -302,18 +508,34 @@ def update_plugin_attributes(source, target):
 
     :param target: maya shape node
     :type target: str
+
+    :param m_source_node: the source dependency node if already resolved
+    :type m_source_node: MFnDependencyNode
+
+    :param m_target_node: the target dependency node if already resolved
+    :type m_target_node: MFnDependencyNode
     """
 
     source_attrs = cmds.listAttr(source, fromPlugin=True) or []
-    taget_attrs = cmds.listAttr(target, fromPlugin=True) or []
+    target_attrs = set(cmds.listAttr(target, fromPlugin=True) or [])
+
+    # keeps the source order to update parent attributes before children
+    common_attrs = [x for x in source_attrs if x in target_attrs]
+
+    # gets the dependency nodes once for all the attributes
+    if not m_source_node:
+        m_source_node = get_dependency_node(source)
+    if not m_target_node:
+        m_target_node = get_dependency_node(target)
 
     logger.debug("Updating  plugin attributes on {}".format(target))
-    for attribute in source_attrs:
-        if attribute in taget_attrs:
-            update_attribute(source, target, attribute)
+    for attribute in common_attrs:
+        update_attribute(source, target, attribute, m_source_node,
+                         m_target_node)
 
 
 @timer
+@fast_update
 def update_rig(source, target, options):
     """ Updates all shapes from the given source group to the target group
 
@@ -325,60 +547,116 @@ def update_rig(source, target, options):
 
     :param options: update options
     :type options: dict
+
+    .. note:: The evaluation manager is turned off (DG mode) by the
+              fast_update decorator while updating the shapes and restored
+              afterwards. Parallel evaluation can fail or crash when nodes
+              are computed concurrently during this kind of bulk edits, and
+              every connectAttr/disconnectAttr done here would force a
+              rebuild of the evaluation graph. In DG mode the shapes are
+              evaluated serially and the graph is only rebuilt once, when
+              the previous mode is restored.
     """
 
+    # gets the prefix-less shapes once for the matching and missing shapes
+    sources_dict, targets_dict = get_clean_matching_shapes(source, target)
+
     # gets the matching shapes
-    matching_shapes = get_matching_shapes_from_group(source, target)
+    matching_shapes = get_matching_shapes(sources_dict, targets_dict)
 
     logger.info("-" * 90)
-    logger.info("Matching shapes: {}" .format(matching_shapes))
+    logger.info("Matching shapes: %s", matching_shapes)
     logger.info("-" * 90)
 
-    for shape in matching_shapes:
+    # matching topology deformed shapes updated all at once
+    deformed_shapes = []
+
+    # gets the options once outside of the shapes loop
+    deformed = options["deformed"]
+    transformed = options["transformed"]
+    hold_transform_values = options["hold_transform_values"]
+    user_attributes = options["user_attributes"]
+    plugin_attributes = options["plugin_attributes"]
+    skip_identical_shapes = options.get("skip_identical_shapes", True)
+
+    # gathers all the maya attributes to update in a single list
+    maya_attributes = []
+    if options["object_display"]:
+        maya_attributes.extend(OBJECT_DISPLAY_ATTRIBUTES)
+    if options["component_display"]:
+        maya_attributes.extend(COMPONENT_DISPLAY_ATTRIBUTES)
+    if options["render_attributes"]:
+        maya_attributes.extend(RENDER_STATS_ATTRIBUTES)
+
+    # queries the source shapes type attributes and the target orig shapes
+    # once for the shapes update
+    shapes_attributes = {}
+    orig_map = {}
+    if deformed or transformed:
+        shapes_attributes = dict([(x, get_shape_type_attributes(x))
+                                  for x in matching_shapes])
+        orig_map = dict([(x, get_shape_orig(x) or [])
+                         for x in matching_shapes.values()])
+
+    # updates the meshes from the lightest to the heaviest one so the
+    # geometry buffers allocated by Maya grow progressively
+    shapes_order = list(matching_shapes.items())
+    if deformed or transformed:
+        shapes_order.sort(key=lambda x: get_vertice_count(x[0])
+                          if shapes_attributes[x[0]]["type"] == "mesh" else 0)
+
+    for shape, target_shape in shapes_order:
         logger.debug("-" * 90)
-        logger.debug("Updating: {}".format(matching_shapes[shape]))
-
-        if options["deformed"]:
-            update_deformed_shape(shape, matching_shapes[shape],
-                                  options["mismatched_topologies"])
-
-        if options["transformed"]:
-            update_transformed_shape(shape, matching_shapes[shape],
-                                     options["hold_transform_values"])
-
-        if options["user_attributes"]:
-            update_user_attributes(shape, matching_shapes[shape])
-
-        if options["object_display"]:
-            logger.debug("Updating object display attributes on {}"
-                         .format(matching_shapes[shape]))
-            update_maya_attributes(shape, matching_shapes[shape],
-                                   OBJECT_DISPLAY_ATTRIBUTES)
-
-        if options["component_display"]:
-            logger.debug("Updating component display attributes on {}"
-                         .format(matching_shapes[shape]))
-            update_maya_attributes(shape, matching_shapes[shape],
-                                   COMPONENT_DISPLAY_ATTRIBUTES)
-
-        if options["render_attributes"]:
-            logger.debug("Updating render attributes on {}"
-                         .format(matching_shapes[shape]))
-            update_maya_attributes(shape, matching_shapes[shape],
-                                   RENDER_STATS_ATTRIBUTES)
-
-        if options["plugin_attributes"]:
-            update_plugin_attributes(shape, matching_shapes[shape])
+        logger.debug("Updating: %s", target_shape)
+
+        # skips the deformed update if the orig shape is already identical
+        if (deformed and skip_identical_shapes and orig_map[target_shape]
+                and is_matching_geometry(shape, orig_map[target_shape][0],
+                                         shapes_attributes[shape]["type"])):
+            logger.debug("Identical shape found, skipping: %s",
+                         target_shape)
+
+        elif deformed:
+            update_deformed_shape(shape, target_shape, options,
+                                  deformed_shapes, orig_map[target_shape])
+
+        if transformed:
+            update_transformed_shape(shape, target_shape,
+                                     hold_transform_values,
+                                     shapes_attributes[shape],
+                                     orig_map[target_shape])
+
+        # gets the dependency nodes once for all the attributes updates
+        if user_attributes or maya_attributes or plugin_attributes:
+            m_source_node = get_dependency_node(shape)
+            m_target_node = get_dependency_node(target_shape)
+
+        if user_attributes:
+            update_user_attributes(shape, target_shape, m_source_node,
+                                   m_target_node)
+
+        if maya_attributes:
+            logger.debug("Updating maya attributes on %s", target_shape)
+            update_maya_attributes(shape, target_shape, maya_attributes,
+                                   m_source_node, m_target_node)
+
+        if plugin_attributes:
+            update_plugin_attributes(shape, target_shape, m_source_node,
+                                     m_target_node)
+
+    # updates the batched deformed shapes
+    update_deformed_shapes(deformed_shapes)
 
     logger.info("-" * 90)
-    logger.info("Source missing shapes: {}" .format(
-        get_missing_shapes_from_group(source, target)))
-    logger.info("Target missing shapes: {}" .format(
-        get_missing_shapes_from_group(target, source)))
+    # the shapes dicts are only formatted if the info level is enabled
+    logger.info("Source missing shapes: %s",
+                get_missing_shapes(sources_dict, targets_dict))
+    logger.info("Target missing shapes: %s",
+                get_missing_shapes(targets_dict, sources_dict))
     logger.info("-" * 90)
 
 
-def update_skincluster_node(source_skin, target_skin):
+def update_skincluster_node(source_skin, target_skin, use_normals=False):
     """ Updates the skin weights on the given target skin from the source skin
 
     :param source_skin: the source skin cluster node name
@@ -386,6 +664,9 @@ def update_skincluster_node(source_skin, target_skin):
 
     :param target_skin: the target skin cluster node name
     :type target_skin: str
+
+    :param use_normals: use the normal based weights transfer
+    :type use_normals: bool
     """
 
     if not source_skin and not target_skin:
@@ -398,11 +679,16 @@ def update_skincluster_node(source_skin, target_skin):
     logger.info("Copying skinning from {} to {}".format(source_skin[0],
                                                         target_skin))
 
+    # copy skin weights using normals
+    if use_normals and copy_skin_weights_normal(source_skin[0],
+                                                target_skin[0]):
+        return
+
     # copy skin weights
     copy_skin_weights(source_skin[0], target_skin[0])
 
 
-def update_transform(source, target):
+def update_transform(source, target, attributes=None):
     """ Updates the transform node on target
 
     This method creates a duplicate of the transform node on source and
@@ -413,6 +699,9 @@ def update_transform(source, target):
 
     :param target: maya shape node
     :type target: str
+
+    :param attributes: the source shape type attributes if already queried
+    :type attributes: dict
     """
 
     logger.debug("Updating transform node on {} from {}".format(target,
@@ -426,11 +715,13 @@ def update_transform(source, target):
     cmds.parent(target, holder, add=True, shape=True)
 
     # unlock locked attributes on holder transform node
-    for attr in cmds.listAttr(holder, locked=True) or []:
-        cmds.setAttr("{}.{}".format(holder, attr), lock=False)
+    unlock_cmds = ['setAttr -lock false "{}.{}"'.format(holder, attr)
+                   for attr in cmds.listAttr(holder, locked=True) or []]
+    if unlock_cmds:
+        mel.eval(";\n".join(unlock_cmds) + ";")
 
     # updates the shape
-    update_shape(source, target)
+    update_shape(source, target, attributes)
 
     # parents new shape under the correct place
     target_parent = get_parent(target)[0]
@@ -441,7 +732,8 @@ def update_transform(source, target):
                                     [-1]))
 
 
-def update_transformed_shape(source, target, hold_transform):
+def update_transformed_shape(source, target, hold_transform,
+                             attributes=None, shape_orig=None):
     """ Updates the target shape with the given source shape content
 
     :param source: maya shape node
@@ -452,9 +744,14 @@ def update_transformed_shape(source, target, hold_transform):
 
     :param hold_transform: keeps the transform node position values
     :type hold_transform: bool
+
+    :param shape_orig: the target orig shapes if already queried
+    :type shape_orig: list
     """
 
-    deform_origin = get_shape_orig(target)
+    deform_origin = shape_orig
+    if deform_origin is None:
+        deform_origin = get_shape_orig(target)
 
     if deform_origin:
         return
@@ -463,14 +760,15 @@ def update_transformed_shape(source, target, hold_transform):
 
     # maintain transform on target
     if hold_transform:
-        update_shape(source, target)
+        update_shape(source, target, attributes)
 
     # update target transform
     else:
-        update_transform(source, target)
+        update_transform(source, target, attributes)
 
 
-def update_user_attributes(source, target):
+def update_user_attributes(source, target, m_source_node=None,
+                           m_target_node=None):
     """ Updates the target shape attributes with the given source shape content
 
     :param source: maya shape node
@@ -479,35 +777,58 @@ def update_user_attributes(source, target):
     :param target: maya shape node
     :type target: str
 
+    :param m_source_node: the source dependency node if already resolved
+    :type m_source_node: MFnDependencyNode
+
+    :param m_target_node: the target dependency node if already resolved
+    :type m_target_node: MFnDependencyNode
+
     .. note:: This method loops twice on the use attributes. One time to add
               the missing attributes and the second to set their value. This
               allows avoiding issues when dealing with child attributes.
     """
 
+    # gets the source dependency node once for all the attributes
+    if not m_source_node:
+        m_source_node = get_dependency_node(source)
+
     # get user defined attributes
-    user_attributes = cmds.listAttr(source, userDefined=True)
+    user_attributes = get_user_attributes(source, m_source_node)
 
     if not user_attributes:
         return
 
     logger.debug("Updating user attributes on {}".format(target))
 
+    if not m_target_node:
+        m_target_node = get_dependency_node(target)
+
     # loop on user defined attributes if any to ---> addAttr
-    for attr in user_attributes:
-        # adds attribute on shape
-        add_attribute(source, target, attr)
+    # the commands are gathered and run all at once
+    add_attr_cmds = [get_add_attribute_cmd(source, target, attr,
+                                           m_source_node)
+                     for attr in user_attributes
+                     if not m_target_node.hasAttribute(attr)]
+
+    if add_attr_cmds:
+        mel.eval(";\n".join(add_attr_cmds) + ";")
 
     # loop on user defined attributes if any to ---> setAttr
-    for attr in user_attributes:
-        # updates the attribute values
-        update_attribute(source, target, attr)
+    update_maya_attributes(source, target, user_attributes, m_source_node,
+                           m_target_node)
 
 
-def update_uvs_sets(shape):
+def update_uvs_sets(shape, node_type=None):
     """ Forces a given mesh shape uvs to update
+
+    :param shape: maya shape node
+    :type shape: str
+
+    :param node_type: the shape node type if already known
+    :type node_type: str
     """
 
-    if cmds.objectType(shape) != "mesh":
+    if (node_type or cmds.objectType(shape)) != "mesh":
         return
 
     # forces uv refresh
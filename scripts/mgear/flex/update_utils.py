@@ -16,14 +16,16 @@ from mgear.flex import logger
 from mgear.flex.attributes import BLENDSHAPE_TARGET
 from mgear.flex.decorators import timer
 from mgear.flex.query import get_dependency_node
+from mgear.flex.query import get_parent
 from mgear.flex.query import get_prefix_less_name
 from mgear.flex.query import get_shape_orig
 from mgear.flex.query import get_shape_type_attributes
+from mgear.flex.query import get_skin_cluster_node
 from mgear.flex.query import get_temp_folder
 from mgear.flex.query import is_matching_type
 
 
-def add_attribute(source, target, attribute_name):
+def add_attribute(source, target, attribute_name, m_depend_node=None):
     """ Adds the given attribute to the given object
 
     .. note:: This is a generic method to **addAttr** all type of attributes
@@ -40,27 +42,21 @@ def add_attribute(source, target, attribute_name):
 
     :param attribute_name: the attribute name to add in the given element
     :type attribute_name: str
+
+    :param m_depend_node: the source dependency node if already resolved
+    :type m_depend_node: MFnDependencyNode
     """
 
     # check if attribute already exists on target
-    if cmds.objExists("{}.{}".format(target, attribute_name)):
+    if get_dependency_node(target).hasAttribute(attribute_name):
         return
 
-    logger.info("Adding {} attribute on {}".format(attribute_name, target))
-
-    # gets the given attribute_name plug attribute
-    m_depend_node = get_dependency_node(source)
-    m_attribute = m_depend_node.findPlug(attribute_name).attribute()
-
-    # gets the addAttr command from the MFnAttribute function
-    fn_attr = OpenMaya.MFnAttribute(m_attribute)
-    add_attr_cmd = fn_attr.getAddAttrCmd()[1:-1]
-
     # creates the attribute on the target
-    mel.eval("{} {}".format(add_attr_cmd, target))
+    mel.eval(get_add_attribute_cmd(source, target, attribute_name,
+                                   m_depend_node))
 
 
-def clean_uvs_sets(shape):
+def clean_uvs_sets(shape, node_type=None):
     """ Deletes all uv sets besides map1
 
     This is used to be able to update target shapes with whatever the source
@@ -68,22 +64,32 @@ def clean_uvs_sets(shape):
 
     :param shape: The Maya shape node
     :type shape: string
+
+    :param node_type: the shape node type if already known
+    :type node_type: string
     """
 
     # check if shape is not a mesh type node
-    if cmds.objectType(shape) != "mesh":
+    if (node_type or cmds.objectType(shape)) != "mesh":
         return
 
     logger.debug("Cleaning uv sets on {}".format(shape))
 
     # gets uvs indices
-    uvs_idx = cmds.getAttr("{}.uvSet".format(shape), multiIndices=True)
+    m_plug = get_dependency_node(shape).findPlug("uvSet", False)
+    uvs_idx = OpenMaya.MIntArray()
+    m_plug.getExistingArrayAttributeIndices(uvs_idx)
+
+    # nothing to clean when the shape only has map1
+    if uvs_idx.length() < 2:
+        return
 
     # deletes the extra indices
-    for idx in uvs_idx:
-        if idx:
-            cmds.setAttr("{}.uvSet[{}]".format(shape, idx), lock=False)
-            cmds.removeMultiInstance("{}.uvSet[{}]".format(shape, idx))
+    for i in range(uvs_idx.length()):
+        if uvs_idx[i]:
+            uv_set = "{}.uvSet[{}]".format(shape, uvs_idx[i])
+            cmds.setAttr(uv_set, lock=False)
+            cmds.removeMultiInstance(uv_set)
 
 
 def copy_blendshape_node(node, target):
@@ -101,8 +107,11 @@ def copy_blendshape_node(node, target):
 
     logger.debug("Copying blendshape node {} to {}".format(node, target))
 
+    # weight attributes names on the source and copied node
+    node_weight = "{}.weight".format(node)
+
     # get blendshape targets indices
-    targets_idx = cmds.getAttr("{}.weight".format(node), multiIndices=True)
+    targets_idx = cmds.getAttr(node_weight, multiIndices=True)
 
     # skip node if no targets where found
     if not targets_idx:
@@ -114,6 +123,7 @@ def copy_blendshape_node(node, target):
     # creates blendshape deformer node on target
     node_copy = cmds.deformer(target, type="blendShape", name="flex_copy_{}"
                               .format(node))[0]
+    node_copy_weight = "{}.weight".format(node_copy)
 
     # loop on blendshape targets indices
     for idx in targets_idx:
@@ -121,15 +131,16 @@ def copy_blendshape_node(node, target):
         attr_name = (BLENDSHAPE_TARGET.format(node, idx))
 
         # blendshape target name
-        target_name = cmds.aliasAttr("{}.weight[{}]".format(node, idx),
+        target_name = cmds.aliasAttr("{}[{}]".format(node_weight, idx),
                                      query=True)
 
         # checks for empty target
-        if not cmds.getAttr(attr_name, multiIndices=True):
+        geometry_targets = cmds.getAttr(attr_name, multiIndices=True)
+        if not geometry_targets:
             continue
 
         # loop on actual targets and in-between targets
-        for target in cmds.getAttr(attr_name, multiIndices=True):
+        for target in geometry_targets:
             # target attribute name
             target_attr = "{}[{}]".format(attr_name, target)
 
@@ -153,15 +164,15 @@ def copy_blendshape_node(node, target):
             continue
 
         # forces the weight attribute to be shown on the blendshape node
-        cmds.setAttr("{}.weight[{}]".format(node_copy, idx), 0)
+        copy_weight_attr = "{}[{}]".format(node_copy_weight, idx)
+        cmds.setAttr(copy_weight_attr, 0)
 
         # updates blendshape node attribute name
         if target_name:
-            cmds.aliasAttr(target_name, "{}.weight[{}]"
-                           .format(node_copy, idx))
+            cmds.aliasAttr(target_name, copy_weight_attr)
 
     # gets targets on copied node to see if there is any node with zero target
-    idx = cmds.getAttr("{}.weight".format(node_copy), multiIndices=True)
+    idx = cmds.getAttr(node_copy_weight, multiIndices=True)
     if not idx:
         cmds.delete(node_copy)
         return
@@ -263,6 +274,232 @@ def copy_skin_weights(source_skin, target_skin):
     cmds.refresh()
 
 
+@timer
+def copy_skin_weights_by_index(source_skin, target_skin):
+    """ Copy skin weights between two skin clusters sharing the same topology
+
+    The weights are read and written per vertex index through the
+    MFnSkinCluster class, skipping the closest point search done by the
+    copySkinWeights command. This is only valid when both skinned shapes
+    are meshes with the same vertices count and the same influences.
+
+    :param source_skin: the source skin cluster node name
+    :type source_skin: str
+
+    :param target_skin: the target skin cluster node name
+    :type target_skin: str
+
+    :return: if the weights could be copied by index
+    :rtype: bool
+    """
+
+    m_source_skin = get_skin_cluster_node(source_skin)
+    m_target_skin = get_skin_cluster_node(target_skin)
+
+    # gets the skinned shapes
+    source_path = OpenMaya.MDagPath()
+    target_path = OpenMaya.MDagPath()
+    m_source_skin.getPathAtIndex(0, source_path)
+    m_target_skin.getPathAtIndex(0, target_path)
+
+    if (not source_path.hasFn(OpenMaya.MFn.kMesh) or
+            not target_path.hasFn(OpenMaya.MFn.kMesh)):
+        return False
+
+    # checks the topology matches
+    vertex_count = OpenMaya.MFnMesh(source_path).numVertices()
+    if vertex_count != OpenMaya.MFnMesh(target_path).numVertices():
+        return False
+
+    # gets the influences on both skin cluster nodes
+    source_influences = OpenMaya.MDagPathArray()
+    target_influences = OpenMaya.MDagPathArray()
+    m_source_skin.influenceObjects(source_influences)
+    m_target_skin.influenceObjects(target_influences)
+
+    if source_influences.length() != target_influences.length():
+        return False
+
+    # matches the target influences indices with the source ones
+    target_names = [target_influences[i].fullPathName()
+                    for i in range(target_influences.length())]
+    source_indices = OpenMaya.MIntArray()
+    target_indices = OpenMaya.MIntArray()
+    for i in range(source_influences.length()):
+        name = source_influences[i].fullPathName()
+        if name not in target_names:
+            return False
+        source_indices.append(i)
+        target_indices.append(target_names.index(name))
+
+    # creates a component holding all the vertices
+    m_component_fn = OpenMaya.MFnSingleIndexedComponent()
+    m_components = m_component_fn.create(OpenMaya.MFn.kMeshVertComponent)
+    m_component_fn.setCompleteData(vertex_count)
+
+    # copy the weights
+    weights = OpenMaya.MDoubleArray()
+    m_source_skin.getWeights(source_path, m_components, source_indices,
+                             weights)
+    m_target_skin.setWeights(target_path, m_components, target_indices,
+                             weights, False)
+
+    return True
+
+
+@timer
+def copy_skin_weights_normal(source_skin, target_skin, max_distance=None):
+    """ Copy skin weights using a normal based closest point association
+
+    The weights are first copied with copy_skin_weights (closest point).
+    Then for each target vertex a ray is cast along the vertex normal (on
+    both directions) onto the source skinned mesh and the non-zero weights of
+    the hit triangle vertices are blended using the hit barycentric
+    coordinates. Vertices without any hit inside the given distance keep the
+    closest point weights.
+
+    This avoids the wrong associations that a position only search gives on
+    overlapping surfaces like garments.
+
+    :param source_skin: the source skin cluster node name
+    :type source_skin: str
+
+    :param target_skin: the target skin cluster node name
+    :type target_skin: str
+
+    :param max_distance: maximum distance allowed between a vertex and a hit.
+                         Defaults to a tenth of the source mesh bounding box
+                         diagonal.
+    :type max_distance: float
+
+    :return: if the weights could be copied
+    :rtype: bool
+    """
+
+    m_source_skin = get_skin_cluster_node(source_skin)
+    m_target_skin = get_skin_cluster_node(target_skin)
+
+    # gets the skinned shapes
+    source_path = OpenMaya.MDagPath()
+    target_path = OpenMaya.MDagPath()
+    m_source_skin.getPathAtIndex(0, source_path)
+    m_target_skin.getPathAtIndex(0, target_path)
+
+    if (not source_path.hasFn(OpenMaya.MFn.kMesh) or
+            not target_path.hasFn(OpenMaya.MFn.kMesh)):
+        return False
+
+    # gets the influences on both skin cluster nodes
+    source_influences = OpenMaya.MDagPathArray()
+    target_influences = OpenMaya.MDagPathArray()
+    m_source_skin.influenceObjects(source_influences)
+    m_target_skin.influenceObjects(target_influences)
+
+    source_names = [source_influences[i].fullPathName()
+                    for i in range(source_influences.length())]
+    target_names = [target_influences[i].fullPathName()
+                    for i in range(target_influences.length())]
+
+    if sorted(source_names) != sorted(target_names):
+        return False
+
+    # copy the closest point weights used by the vertices without any hit
+    copy_skin_weights(source_skin, target_skin)
+
+    logger.info("Copying skinning with normals from {} to {}"
+                .format(source_skin, target_skin))
+
+    # target influences logical indices using the source influences order
+    influence_count = len(source_names)
+    logical_indices = [m_target_skin.indexForInfluenceObject(
+                       target_influences[target_names.index(x)])
+                       for x in source_names]
+    source_indices = OpenMaya.MIntArray()
+    for i in range(influence_count):
+        source_indices.append(i)
+
+    # gets the source weights
+    source_mesh = OpenMaya.MFnMesh(source_path)
+    m_component_fn = OpenMaya.MFnSingleIndexedComponent()
+    m_components = m_component_fn.create(OpenMaya.MFn.kMeshVertComponent)
+    m_component_fn.setCompleteData(source_mesh.numVertices())
+
+    m_weights = OpenMaya.MDoubleArray()
+    m_source_skin.getWeights(source_path, m_components, source_indices,
+                             m_weights)
+
+    # keeps only the non-zero weights of each source vertex
+    source_weights = []
+    for v in range(source_mesh.numVertices()):
+        offset = v * influence_count
+        source_weights.append([(logical_indices[i], m_weights[offset + i])
+                               for i in range(influence_count)
+                               if m_weights[offset + i]])
+
+    # gets the maximum distance from the source bounding box
+    if max_distance is None:
+        m_bounding_box = OpenMaya.MFnDagNode(source_path).boundingBox()
+        m_bounding_box.transformUsing(source_path.inclusiveMatrix())
+        max_distance = m_bounding_box.min().distanceTo(
+            m_bounding_box.max()) * 0.1
+
+    # intersection arguments
+    accel_params = source_mesh.autoUniformGridParams()
+    hit_point = OpenMaya.MFloatPoint()
+    utils = [OpenMaya.MScriptUtil() for i in range(5)]
+    hit_param = utils[0].asFloatPtr()
+    hit_face = utils[1].asIntPtr()
+    hit_triangle = utils[2].asIntPtr()
+    hit_bary1 = utils[3].asFloatPtr()
+    hit_bary2 = utils[4].asFloatPtr()
+    triangle_util = OpenMaya.MScriptUtil()
+    triangle_util.createFromList([0, 0, 0], 3)
+    triangle = triangle_util.asIntPtr()
+
+    # loop on the target vertices
+    weights_size = max(logical_indices) + 1
+    normal = OpenMaya.MVector()
+    m_vertex_it = OpenMaya.MItMeshVertex(target_path)
+    while not m_vertex_it.isDone():
+        position = m_vertex_it.position(OpenMaya.MSpace.kWorld)
+        m_vertex_it.getNormal(normal, OpenMaya.MSpace.kWorld)
+
+        hit = source_mesh.closestIntersection(
+            OpenMaya.MFloatPoint(position.x, position.y, position.z),
+            OpenMaya.MFloatVector(normal.x, normal.y, normal.z),
+            None, None, False, OpenMaya.MSpace.kWorld, max_distance, True,
+            accel_params, hit_point, hit_param, hit_face, hit_triangle,
+            hit_bary1, hit_bary2)
+
+        # keeps the closest point weights
+        if not hit:
+            m_vertex_it.next()
+            continue
+
+        # blends the hit triangle vertices non-zero weights
+        source_mesh.getPolygonTriangleVertices(
+            OpenMaya.MScriptUtil.getInt(hit_face),
+            OpenMaya.MScriptUtil.getInt(hit_triangle), triangle)
+        bary1 = OpenMaya.MScriptUtil.getFloat(hit_bary1)
+        bary2 = OpenMaya.MScriptUtil.getFloat(hit_bary2)
+        factors = [bary1, bary2, 1.0 - bary1 - bary2]
+
+        weights = [0.0] * weights_size
+        for i, factor in enumerate(factors):
+            vertex = OpenMaya.MScriptUtil.getIntArrayItem(triangle, i)
+            for index, weight in source_weights[vertex]:
+                weights[index] += weight * factor
+
+        # sets the weights through an undoable command
+        cmds.setAttr("{}.weightList[{}].weights[0:{}]".format(
+                     target_skin, m_vertex_it.index(), weights_size - 1),
+                     *weights, size=weights_size)
+
+        m_vertex_it.next()
+
+    return True
+
+
 @timer
 def create_blendshapes_backup(source, target, nodes):
     """ Creates an updated backup for the given blendshapes nodes on source
@@ -316,6 +553,9 @@ def create_blendshapes_backup(source, target, nodes):
 
     return_nodes = []
 
+    # warp target output attribute
+    warp_output = "{}.{}".format(warp_target, attrs["output"])
+
     # loops on the blendshape nodes
     for node in nodes_copy:
         # creates transfer blendshape
@@ -331,16 +571,16 @@ def create_blendshapes_backup(source, target, nodes):
             # input target group attribute
             attr_name = (BLENDSHAPE_TARGET.format(node, idx))
 
-            # blendshape target name
-            target_name = cmds.aliasAttr("{}.weight[{}]".format(node, idx),
-                                         query=True)
+            # blendshape target weight attribute and name
+            weight_attr = "{}.weight[{}]".format(node, idx)
+            target_name = cmds.aliasAttr(weight_attr, query=True)
 
             # loop on actual targets and in-between targets
             for target in cmds.getAttr(attr_name, multiIndices=True):
 
                 # gets and sets the blendshape weight value
                 weight = float((target - 5000) / 1000.0)
-                cmds.setAttr("{}.weight[{}]".format(node, idx), weight)
+                cmds.setAttr(weight_attr, weight)
 
                 # geometry target attribute
                 geometry_target_attr = "{}[{}].inputGeomTarget".format(
@@ -350,27 +590,22 @@ def create_blendshapes_backup(source, target, nodes):
                     geometry_target_attr.split(".")[0], transfer_node)
 
                 # updates the target
-                cmds.connectAttr("{}.{}".format(warp_target, attrs["output"]),
-                                 shape_target, force=True)
+                cmds.connectAttr(warp_output, shape_target, force=True)
+                cmds.disconnectAttr(warp_output, shape_target)
 
-                cmds.disconnectAttr("{}.{}"
-                                    .format(warp_target, attrs["output"]),
-                                    shape_target)
+                cmds.setAttr(weight_attr, 0)
 
-                cmds.setAttr("{}.weight[{}]".format(node, idx), 0)
-
-            cmds.setAttr("{}.weight[{}]".format(transfer_node, idx), 0)
+            transfer_weight_attr = "{}.weight[{}]".format(transfer_node, idx)
+            cmds.setAttr(transfer_weight_attr, 0)
 
             if target_name:
-                cmds.aliasAttr(target_name, "{}.weight[{}]".format(
-                    transfer_node, idx))
+                cmds.aliasAttr(target_name, transfer_weight_attr)
 
         # adds blendshape node to nodes to return
         return_nodes.append("{}".format(transfer_node))
 
     # deletes backup process shapes
-    cmds.delete(cmds.listRelatives(source_duplicate, parent=True),
-                cmds.listRelatives(warp_target, parent=True))
+    cmds.delete(get_parent(source_duplicate), get_parent(warp_target))
 
     # forces refresh
     cmds.refresh()
@@ -497,7 +732,10 @@ def create_skincluster_backup(shape, skin_node):
     logger.info("Creating skin backup for {}".format(skin_node))
 
     # gets the skin cluster influences
-    influences = cmds.listConnections("{}.matrix".format(skin_node))
+    m_influences = OpenMaya.MDagPathArray()
+    get_skin_cluster_node(skin_node).influenceObjects(m_influences)
+    influences = [m_influences[i].partialPathName()
+                  for i in range(m_influences.length())]
 
     # creates a duplicate shape of the given shape
     holder_name = "{}_flex_skin_shape_holder".format(
@@ -511,8 +749,10 @@ def create_skincluster_backup(shape, skin_node):
                                    removeUnusedInfluence=False, name="{}_SKN"
                                    .format(holder_name))
 
-    # copy the given skin node weights to back up shape
-    copy_skin_weights(skin_node, skin_holder[0])
+    # copy the given skin node weights to back up shape. The backup is a
+    # duplicate of the orig shape so the weights can be copied by index
+    if not copy_skin_weights_by_index(skin_node, skin_holder[0]):
+        copy_skin_weights(skin_node, skin_holder[0])
 
     return ["{}".format(skin_holder[0])]
 
@@ -576,8 +816,10 @@ def delete_transform_from_nodes(nodes):
 
     for node in nodes:
         try:
+            deformers = set(cmds.listHistory(node, future=True, pdo=True)
+                            or [])
             shape = [x for x in cmds.listHistory(node, future=True)
-                     if x not in cmds.listHistory(node, future=True, pdo=True)]
+                     if x not in deformers]
             transform = cmds.listRelatives(shape, parent=True)
             cmds.delete(transform)
         except ValueError:
@@ -615,6 +857,43 @@ def filter_shape_orig(shape, intermediate):
         return shape
 
 
+def get_add_attribute_cmd(source, target, attribute_name,
+                          m_depend_node=None):
+    """ Returns the addAttr command creating the source attribute on target
+
+    This allows gathering the commands for several attributes and running
+    them all at once.
+
+    :param source: the maya source node
+    :type source: str
+
+    :param target: the maya target node
+    :type target: str
+
+    :param attribute_name: the attribute name to add in the given element
+    :type attribute_name: str
+
+    :param m_depend_node: the source dependency node if already resolved
+    :type m_depend_node: MFnDependencyNode
+
+    :return: the addAttr MEL command
+    :rtype: str
+    """
+
+    logger.info("Adding {} attribute on {}".format(attribute_name, target))
+
+    # gets the given attribute_name plug attribute
+    if not m_depend_node:
+        m_depend_node = get_dependency_node(source)
+    m_attribute = m_depend_node.findPlug(attribute_name).attribute()
+
+    # gets the addAttr command from the MFnAttribute function
+    fn_attr = OpenMaya.MFnAttribute(m_attribute)
+    add_attr_cmd = fn_attr.getAddAttrCmd()[1:-1]
+
+    return "{} {}".format(add_attr_cmd, target)
+
+
 def set_deformer_off(deformer):
     """ Set envelope attribute to **0** on the given deformer
 
@@ -648,29 +927,56 @@ def set_deformer_on(deformer):
         cmds.mute("{}.envelope".format(deformer), disable=True, force=True)
 
 
-def set_deformer_state(deformers, enable):
+def set_deformer_state(deformers, enable, envelopes=None):
     """ Set envelope attribute to one on the given deformers dictionary
 
+    The envelopes values found when disabling the deformers are returned.
+    When enabling the deformers with those values, the original envelopes
+    values are restored instead of forced to **1**.
+
     :param deformers: dict containing the deformers set by type
     :type deformers: type
 
     :param enable: on or off state for the given deformers
     :type enable: bool
+
+    :param envelopes: envelopes values returned when disabling the deformers
+    :type envelopes: dict
+
+    :return: the envelopes values found before the edit by deformer
+    :rtype: dict
     """
 
     logger.debug("Setting deformers {} envelop enable to: {}"
                  .format(deformers, enable))
 
+    previous_envelopes = {}
+
     # Loop of the deformer dict and set state
-    for deformer_type in deformers:
-        for i in deformers[deformer_type] or []:
+    for deformer in [x for v in deformers.values() for x in v or []]:
+        m_plug = get_dependency_node(deformer).findPlug("envelope", False)
+
+        # connected or locked envelopes are handled by the mute node methods
+        if m_plug.isDestination() or m_plug.isLocked():
             if enable:
-                set_deformer_on(i)
+                set_deformer_on(deformer)
                 continue
-            set_deformer_off(i)
+            set_deformer_off(deformer)
+            continue
+
+        previous_envelopes[deformer] = m_plug.asFloat()
+
+        # restores the previous value if given
+        value = float(enable)
+        if enable and envelopes:
+            value = envelopes.get(deformer, value)
+
+        cmds.setAttr("{}.envelope".format(deformer), value)
 
+    return previous_envelopes
 
-def update_shape(source, target):
+
+def update_shape(source, target, attributes=None):
     """ Connect the shape output from source to the input shape on target
 
     :param source: maya shape node
@@ -678,24 +984,53 @@ def update_shape(source, target):
 
     :param target: maya shape node
     :type target: str
+
+    :param attributes: the source shape type attributes if already queried
+    :type attributes: dict
+    """
+
+    update_shapes([(source, target, attributes)])
+
+
+def update_shapes(shapes):
+    """ Updates all the given target shapes with their source shape content
+
+    All the shapes are connected at once, evaluated together and then
+    disconnected, so the DG is only evaluated once for all of them.
+
+    :param shapes: source shape, target shape and source shape type
+                   attributes (can be None if not queried yet) for each shape
+                   to update
+    :type shapes: list(tuple)
     """
 
-    # clean uvs on mesh nodes
-    clean_uvs_sets(target)
+    connections = []
+
+    for source, target, attributes in shapes:
+        # get attributes names
+        if not attributes:
+            attributes = get_shape_type_attributes(source)
 
-    # get attributes names
-    attributes = get_shape_type_attributes(source)
+        # clean uvs on mesh nodes (source and target share the same type)
+        clean_uvs_sets(target, attributes["type"])
 
-    logger.debug("Updating shape: {} using --> {}".format(target, source))
+        logger.debug("Updating shape: {} using --> {}".format(target,
+                                                              source))
+
+        connections.append(("{}.{}".format(source, attributes["output"]),
+                            "{}.{}".format(target, attributes["input"]),
+                            "{}.{}".format(target, attributes["output"])))
+
+    if not connections:
+        return
 
-    # updates the shape
-    cmds.connectAttr("{}.{}".format(source, attributes["output"]),
-                     "{}.{}".format(target, attributes["input"]),
-                     force=True)
+    # updates the shapes
+    for source_attr, target_attr, output_attr in connections:
+        cmds.connectAttr(source_attr, target_attr, force=True)
 
-    # forces shape evaluation to achieve the update
-    cmds.dgeval("{}.{}".format(target, attributes["output"]))
+    # forces shapes evaluation to achieve the update
+    cmds.dgeval([x[2] for x in connections])
 
-    # finish shape update
-    cmds.disconnectAttr("{}.{}".format(source, attributes["output"]),
-                        "{}.{}".format(target, attributes["input"]))
+    # finish shapes update
+    for source_attr, target_attr, output_attr in connections:
+        cmds.disconnectAttr(source_attr, target_attr)
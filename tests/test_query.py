@@ -1,7 +1,11 @@
 
 # imports
 from maya import cmds
+from mgear.flex.query import get_dependency_node
+from mgear.flex.query import get_plug_value_type
 from mgear.flex.query import get_shapes_from_elem
+from mgear.flex.query import get_user_attributes
+from mgear.flex.query import is_matching_geometry
 
 
 def test_get_shapes_from_elem(initialize_maya):  # @UnusedVariable
@@ -13,3 +17,68 @@ def test_get_shapes_from_elem(initialize_maya):  # @UnusedVariable
     cmds.skinCluster(skin_joint, mesh[0])
 
     assert get_shapes_from_elem(mesh[0]) == ['my_test_sphere_MESHShape']
+
+
+def test_get_plug_value_type(initialize_maya):  # @UnusedVariable
+    """ Test for the get_plug_value_type method """
+
+    # create a sphere with user attributes
+    mesh = cmds.polySphere(name='my_plug_type_sphere_MESH', ch=False)[0]
+    cmds.addAttr(mesh, longName='my_bool', attributeType='bool')
+    cmds.addAttr(mesh, longName='my_enum', attributeType='enum',
+                 enumName='a:b:c')
+    cmds.addAttr(mesh, longName='my_double', attributeType='double')
+    cmds.addAttr(mesh, longName='my_double3', attributeType='double3')
+    for axis in 'XYZ':
+        cmds.addAttr(mesh, longName='my_double3{}'.format(axis),
+                     attributeType='double', parent='my_double3')
+    cmds.addAttr(mesh, longName='my_multi', attributeType='compound',
+                 numberOfChildren=1, multi=True)
+    cmds.addAttr(mesh, longName='my_multi_child', attributeType='double',
+                 parent='my_multi')
+
+    m_node = get_dependency_node(mesh)
+
+    assert get_plug_value_type(m_node.findPlug('my_bool', False)) == 'bool'
+    assert get_plug_value_type(m_node.findPlug('my_enum', False)) == 'int'
+    assert get_plug_value_type(m_node.findPlug('my_double',
+                                               False)) == 'double'
+    assert get_plug_value_type(m_node.findPlug('my_double3X',
+                                               False)) == 'double'
+    assert get_plug_value_type(m_node.findPlug('my_double3', False)) is None
+    assert get_plug_value_type(m_node.findPlug('my_multi', False)) is None
+    assert get_plug_value_type(m_node.findPlug('my_multi_child',
+                                               False)) is None
+
+
+def test_get_user_attributes(initialize_maya):  # @UnusedVariable
+    """ Test for the get_user_attributes method """
+
+    # create a sphere with user attributes
+    mesh = cmds.polySphere(name='my_user_attr_sphere_MESH', ch=False)[0]
+    cmds.addAttr(mesh, longName='my_enum', attributeType='enum',
+                 enumName='a:b:c')
+    cmds.addAttr(mesh, longName='my_double', attributeType='double')
+
+    assert get_user_attributes(mesh) == cmds.listAttr(mesh, userDefined=True)
+    assert get_user_attributes(mesh, get_dependency_node(mesh)) == [
+        'my_enum', 'my_double']
+
+
+def test_is_matching_geometry(initialize_maya):  # @UnusedVariable
+    """ Test for the is_matching_geometry method """
+
+    # create a sphere and a duplicate of its shape
+    mesh = cmds.polySphere(name='my_geometry_sphere_MESH', ch=False)[0]
+    duplicate = cmds.duplicate(mesh, name='my_geometry_duplicate_MESH')[0]
+    shape = cmds.listRelatives(mesh, shapes=True)[0]
+    duplicate_shape = cmds.listRelatives(duplicate, shapes=True)[0]
+
+    assert is_matching_geometry(shape, duplicate_shape)
+    assert is_matching_geometry(shape, duplicate_shape, 'mesh')
+
+    # moves a vertex on the duplicate
+    cmds.move(0, 1, 0, '{}.vtx[0]'.format(duplicate), relative=True)
+
+    assert not is_matching_geometry(shape, duplicate_shape)
+    assert not is_matching_geometry(shape, duplicate_shape, 'nurbsSurface')
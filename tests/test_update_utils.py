@@ -0,0 +1,59 @@
+
+# imports
+from maya import cmds
+from mgear.flex.update_utils import copy_skin_weights_by_index
+from mgear.flex.update_utils import set_deformer_state
+
+
+def test_copy_skin_weights_by_index(initialize_maya):  # @UnusedVariable
+    """ Test for the copy_skin_weights_by_index method """
+
+    # create two spheres skinned to the same joints
+    cmds.select(clear=True)
+    joints = [cmds.joint(name='my_index_joint_{}'.format(i),
+                         position=(0, i, 0)) for i in range(2)]
+    source = cmds.polySphere(name='my_index_source_MESH', ch=False)[0]
+    target = cmds.polySphere(name='my_index_target_MESH', ch=False)[0]
+    source_skin = cmds.skinCluster(joints, source, toSelectedBones=True)[0]
+    target_skin = cmds.skinCluster(joints, target, toSelectedBones=True)[0]
+
+    # sets the source weights on a single joint
+    cmds.skinPercent(source_skin, '{}.vtx[*]'.format(source),
+                     transformValue=[(joints[0], 1.0)])
+
+    assert copy_skin_weights_by_index(source_skin, target_skin)
+    for i in range(cmds.polyEvaluate(target, vertex=True)):
+        assert cmds.skinPercent(target_skin, '{}.vtx[{}]'.format(target, i),
+                                transform=joints[0], query=True) == 1.0
+
+    # mismatching topologies can't be copied by index
+    other = cmds.polySphere(name='my_index_other_MESH', subdivisionsX=10,
+                            ch=False)[0]
+    other_skin = cmds.skinCluster(joints, other, toSelectedBones=True)[0]
+
+    assert not copy_skin_weights_by_index(source_skin, other_skin)
+
+
+def test_set_deformer_state(initialize_maya):  # @UnusedVariable
+    """ Test for the set_deformer_state method """
+
+    # create a sphere with a skin cluster with a half envelope
+    mesh = cmds.polySphere(name='my_envelope_sphere_MESH', ch=False)[0]
+    skin_joint = cmds.createNode('joint', name='my_envelope_joint')
+    skin = cmds.skinCluster(skin_joint, mesh)[0]
+    cmds.setAttr('{}.envelope'.format(skin), 0.5)
+    deformers = {'skinCluster': [skin]}
+
+    envelopes = set_deformer_state(deformers, False)
+
+    assert envelopes == {skin: 0.5}
+    assert cmds.getAttr('{}.envelope'.format(skin)) == 0.0
+
+    set_deformer_state(deformers, True, envelopes)
+
+    assert cmds.getAttr('{}.envelope'.format(skin)) == 0.5
+
+    # enabling without previous values forces the envelope to 1
+    set_deformer_state(deformers, True)
+
+    assert cmds.getAttr('{}.envelope'.format(skin)) == 1.0